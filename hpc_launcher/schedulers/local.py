@@ -36,15 +36,16 @@ class LocalScheduler(Scheduler):
     def launch_command(self, system: "System", blocking: bool = True, cli_env_only: bool = False) -> list[str]:
         return []
 
-    def launcher_script(
+    def launcher_script_to(
         self,
+        fileobj,
         system: "System",
         command: str,
         args: Optional[list[str]] = None,
         blocking: bool = True,
         save_hostlist: bool = False,
         launch_dir: str = "",
-    ) -> str:
+    ) -> None:
         envvars = [parse_env_list(*e) for e in system.environment_variables()]
         envvars += [
             f"export {k}={v}" for k, v in system.passthrough_environment_variables()
@@ -64,13 +65,13 @@ class LocalScheduler(Scheduler):
         if self.work_dir:
             header += f"\ncd {os.path.abspath(self.work_dir)}\n"
 
-        return f"""#!/bin/sh
+        fileobj.write(f"""#!/bin/sh
 # Setup
 {header}
 
 # Run
 {command} {" ".join(args)}
-"""
+""")
 
     def get_job_id(self, output: str) -> Optional[str]:
         return None
@@ -20,10 +20,10 @@ import sys
 import time
 import tempfile
 import subprocess
+import shlex
 import shutil
 import uuid
 from hpc_launcher.cli.console_pipe import run_process_with_live_output
-from hpc_launcher.schedulers import parse_env_list
 
 import logging
 
@@ -153,34 +153,32 @@ class Scheduler:
 
         if not blocking: # Only add batch script header items on non-blocking calls
             prefix = self.batch_script_prefix()
-            for k,v in self.submit_only_args.items():
-                if not for_launch_cmd and k == '--dependency':
-                    continue
-                if not v:
-                    header.write(f"{prefix} {k}\n")
-                else:
-                    header.write(f"{prefix} {k}={v}\n")
-            for k,v in self.common_launch_args.items():
-                if not for_launch_cmd and k == '--dependency':
-                    continue
-                if not v:
-                    header.write(f"{prefix} {k}\n")
-                else:
-                    header.write(f"{prefix} {k}={v}\n")
+            directives = []
+            for launch_args in (self.submit_only_args, self.common_launch_args):
+                for k,v in launch_args.items():
+                    if not for_launch_cmd and k == '--dependency':
+                        continue
+                    if not v:
+                        directives.append(k)
+                    else:
+                        directives.append(f"{k}={v}")
+            if directives:
+                # Emit all of the directives with a single join and write
+                # rather than one interpolated write per directive
+                header.write("\n".join(f"{prefix} {d}" for d in directives))
+                header.write("\n")
 
         if len(env_vars):
             if blocking and cli_env_only:
                 self.cli_env_arg(env_vars)
             else:
-                for e in env_vars:
-                    header.write(parse_env_list(*e))
+                header.write(system.environment_block())
 
         if len(passthrough_env_vars):
             if blocking:
                 self.cli_env_arg(passthrough_env_vars)
             else:
-                for k, v in passthrough_env_vars:
-                    header.write(f"export {k}={v}\n")
+                header.write(system.passthrough_environment_block())
 
         return (header.getvalue(), cmd_args)
 
@@ -284,29 +282,30 @@ class Scheduler:
         """
         raise NotImplementedError
 
-    def launcher_script(
+    def launcher_script_to(
         self,
+        fileobj,
         system: "System",
         command: str,
         args: Optional[list[str]] = None,
         blocking: bool = True,
         save_hostlist: bool = False,
         launch_dir: str = "",
-    ) -> str:
+    ) -> None:
         """
-        Returns the full launcher script, which can be saved as a batch
-        script, for the given system and launcher configuration.
+        Streams the full launcher script to a writable file-like object,
+        avoiding the construction of one large intermediate string.
         This script usually performs node/resource allocation and manages I/O.
 
+        :param fileobj: A writable text-mode file object for the script.
         :param system: The system to use.
         :param command: The command to launch
         :param args: Optional list of argument for the command to launch
         :param blocking: Launch the comamnd interactively if true, else in a batch job
         :params save_hostlist: Add local scripting to capture the list of hosts the command is launched on
         :params launch_dir: Folder used for running the command
-        :return: A shell script as a string.
+        :return: None
         """
-        script = ""
         # Launch command only use the cmd_args to construct the shell script to be launched
         (header_lines, cmd_args) = self.build_command_string_and_batch_script(
             system, blocking, False, for_launch_cmd=False
@@ -327,37 +326,66 @@ class Scheduler:
                     cmd_args += [f"{k}={v}"]
 
         # Configure header and command line with scheduler job options
-        script += header_lines
-        script += "\n"
+        fileobj.write(header_lines)
+        fileobj.write("\n")
         if launch_dir != os.getcwd():
             callee_directory = os.path.dirname(launch_dir)
             logger.info(f"Callee directory: {callee_directory} - and {launch_dir}")
-            script += f"export PYTHONPATH={callee_directory}:" + "${PYTHONPATH}\n"
+            fileobj.write(f"export PYTHONPATH={callee_directory}:" + "${PYTHONPATH}\n")
         if save_hostlist:
-            script += f'export RANK={self.get_parallel_rank_env_variable()}\n'
-            script += self.export_hostlist()
-            script += 'if [ "${RANK}" = "0" ]; then\n'
-            script += "    echo ${HPC_LAUNCHER_HOSTLIST} > " + os.path.join(launch_dir, f"hpc_launcher_hostlist.txt\n")
-            script += "fi\n\n"
+            fileobj.write(f'export RANK={self.get_parallel_rank_env_variable()}\n')
+            fileobj.write(self.export_hostlist())
+            fileobj.write('if [ "${RANK}" = "0" ]; then\n')
+            fileobj.write("    echo ${HPC_LAUNCHER_HOSTLIST} > " + os.path.join(launch_dir, f"hpc_launcher_hostlist.txt\n"))
+            fileobj.write("fi\n\n")
 
         if system.active_system_params:
             system_params = system.active_system_params
             if system_params.fraction_max_gpu_mem and system_params.fraction_max_gpu_mem != 1.0:
-                script += f'export HPC_LAUNCHER_MAX_GPU_MEM={system_params.fraction_max_gpu_mem}\n'
+                fileobj.write(f'export HPC_LAUNCHER_MAX_GPU_MEM={system_params.fraction_max_gpu_mem}\n')
 
         if self.require_parallel_internal_run_command(blocking):
-            script += self.internal_script_run_command()
-            script += " ".join(cmd_args)
-            script += " "
+            fileobj.write(self.internal_script_run_command())
+            fileobj.write(" ".join(cmd_args))
+            fileobj.write(" ")
 
-        script += f"{command}"
+        fileobj.write(command)
 
-        for arg in args:
-            script += f" {arg}"
+        if args:
+            # One join instead of one growing concatenation per argument;
+            # shlex also quotes arguments with spaces or shell metacharacters
+            fileobj.write(" ")
+            fileobj.write(shlex.join(str(arg) for arg in args))
 
-        script += "\n"
+        fileobj.write("\n")
 
-        return script
+    def launcher_script(
+        self,
+        system: "System",
+        command: str,
+        args: Optional[list[str]] = None,
+        blocking: bool = True,
+        save_hostlist: bool = False,
+        launch_dir: str = "",
+    ) -> str:
+        """
+        Returns the full launcher script, which can be saved as a batch
+        script, for the given system and launcher configuration.
+        This script usually performs node/resource allocation and manages I/O.
+
+        :param system: The system to use.
+        :param command: The command to launch
+        :param args: Optional list of argument for the command to launch
+        :param blocking: Launch the comamnd interactively if true, else in a batch job
+        :params save_hostlist: Add local scripting to capture the list of hosts the command is launched on
+        :params launch_dir: Folder used for running the command
+        :return: A shell script as a string.
+        """
+        script = StringIO()
+        self.launcher_script_to(
+            script, system, command, args, blocking, save_hostlist, launch_dir
+        )
+        return script.getvalue()
 
     def internal_script(self, system: "System") -> Optional[str]:
         """
@@ -623,9 +651,9 @@ class Scheduler:
             full_cmdline = cmd + [filename]
             logger.info(f"Script filename: {filename}")
             if not dry_run and not immutable_launch_script:
-                with open(filename, "w") as fp:
-                    fp.write(
-                        self.launcher_script(system, command, args, blocking, save_hostlist, os.path.dirname(filename))
+                with open(filename, "w", buffering=65536) as fp:
+                    self.launcher_script_to(
+                        fp, system, command, args, blocking, save_hostlist, os.path.dirname(filename)
                     )
 
                     fp.write(f"\n# Launch command: " + " ".join(full_cmdline) + "\n")
@@ -14,8 +14,10 @@
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Optional
 from io import StringIO
+import functools
 import os
 import subprocess
+import shutil
 import re
 
 if TYPE_CHECKING:
@@ -32,8 +34,31 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+# Resolve flux once at import time to skip a PATH walk per invocation
+_flux_path = shutil.which("flux")
+# A bytes pattern so that the subprocess output does not need to be decoded
+_node_info_regex = re.compile(rb"^(\d*) Nodes, (\d*) Cores, (\d*) GPUs$", re.MULTILINE)
+
+# The allocation is fixed for the lifetime of a process, so cache the results
+# of querying it, keyed on the allocation identifiers so that a re-exec into
+# a new allocation does not pick up stale values
+_allocation_cache = {}
+
+
+@functools.lru_cache(maxsize=256)
+def _time_string_int(minutes: int) -> str:
+    minutes = max(minutes, 0)
+    hours, minutes = divmod(minutes, 60)
+    days, hours = divmod(hours, 24)
+    return f"{days}-{hours:02}:{minutes:02}:00"
+
+
 def _time_string(minutes):
     """Time D-hh:mm:ss format."""
+    if isinstance(minutes, int):
+        # Integer minutes never carry a seconds component, so skip the float
+        # arithmetic and cache the formatted string
+        return _time_string_int(minutes)
     minutes = max(minutes, 0)
     seconds = int(round((minutes % 1) * 60))
     hours, minutes = divmod(int(minutes), 60)
@@ -44,6 +69,19 @@ def _time_string(minutes):
 @dataclass
 class SlurmScheduler(Scheduler):
 
+    # Simple options that map one scheduler attribute directly to one command
+    # line flag: (attribute name, flag, optional value transform)
+    _submit_only_options = (
+        ("work_dir", "--chdir", os.path.abspath),
+        ("queue", "--partition", None),
+        ("account", "--account", None),
+        ("reservation", "--reservation", None),
+    )
+    _common_launch_options = (
+        ("time_limit", "--time", _time_string),
+        ("job_name", "--job-name", None),
+    )
+
     def build_scheduler_specific_arguments(
         self, system: "System", blocking: bool = True
     ):
@@ -74,14 +112,20 @@ class SlurmScheduler(Scheduler):
         if self.exclusive:
             self.submit_only_args["--exclusive"] = ""
 
-        if self.work_dir:
-            self.submit_only_args["--chdir"] = f"{os.path.abspath(self.work_dir)}"
+        for attr, flag, transform in self._submit_only_options:
+            value = getattr(self, attr)
+            if value is None or value == "":
+                continue
+            self.submit_only_args[flag] = f"{transform(value) if transform else value}"
 
         if self.ld_preloads:
             self.common_launch_args['--export=ALL,LD_PRELOAD'] = f'{",".join(self.ld_preloads)}'
 
-        if self.time_limit is not None:
-            self.common_launch_args["--time"] = f"{_time_string(self.time_limit)}"
+        for attr, flag, transform in self._common_launch_options:
+            value = getattr(self, attr)
+            if value is None or value == "":
+                continue
+            self.common_launch_args[flag] = f"{transform(value) if transform else value}"
 
         if self.dependency is not None:
             self.common_launch_args["--dependency"] = f"{self.dependency}"
@@ -100,18 +144,6 @@ class SlurmScheduler(Scheduler):
                 pass
             self.submit_only_args["--dependency"] = dependency
 
-        if self.job_name:
-            self.common_launch_args["--job-name"] = f"{self.job_name}"
-
-        if self.queue:
-            self.submit_only_args["--partition"] = f"{self.queue}"
-
-        if self.account:
-            self.submit_only_args["--account"] = f"{self.account}"
-
-        if self.reservation:
-            self.submit_only_args["--reservation"] = f"{self.reservation}"
-
         return
 
     def batch_script_prefix(self) -> str:
@@ -148,25 +180,32 @@ class SlurmScheduler(Scheduler):
 
     def get_job_id(self, output: str) -> Optional[str]:
         # The job ID is the last number in the printout
-        last_line = output.strip().split("\n")[-1].strip()
-        if last_line.startswith("Submitted batch job"):
-            return last_line.split(" ")[-1]
+        # rpartition avoids materializing a list of every line just to read
+        # the last one
+        last_line = output.rstrip().rpartition("\n")[2].strip()
+        if last_line.startswith("Submitted batch job "):
+            return last_line[len("Submitted batch job "):]
         return None
 
     @classmethod
     def num_nodes_in_allocation(cls) -> Optional[int]:
+        key = ("num_nodes", os.getenv("FLUX_URI"), os.getenv("SLURM_JOB_ID"))
+        if key in _allocation_cache:
+            return _allocation_cache[key]
+        num_nodes = None
         if os.getenv("FLUX_URI"):
-            cmd = ["flux", "resource", "info"]
-            proc = subprocess.run(cmd, universal_newlines=True, capture_output=True)
-            m = re.search(r"^(\d*) Nodes, (\d*) Cores, (\d*) GPUs$", proc.stdout)
+            cmd = [_flux_path or "flux", "resource", "info"]
+            proc = subprocess.run(cmd, capture_output=True)
+            m = _node_info_regex.search(proc.stdout)
             if m:
-                return int(m.group(1))
+                num_nodes = int(m.group(1))
         elif os.getenv("SLURM_JOB_NUM_NODES"):
-            return int(os.getenv("SLURM_JOB_NUM_NODES"))
+            num_nodes = int(os.getenv("SLURM_JOB_NUM_NODES"))
         elif os.getenv("LLNL_NUM_COMPUTE_NODES"):
-            return int(os.getenv("LLNL_NUM_COMPUTE_NODES"))
+            num_nodes = int(os.getenv("LLNL_NUM_COMPUTE_NODES"))
 
-        return None
+        _allocation_cache[key] = num_nodes
+        return num_nodes
 
     @classmethod
     def get_parallel_rank_env_variable(self) -> str:
@@ -176,6 +215,10 @@ class SlurmScheduler(Scheduler):
     def get_parallel_configuration(cls) -> tuple[int, int, int, int]:
         # Interesting but unused variables SLURM_JOB_NUM_NODES, SLURM_NPROCS, SLURM_DISTRIBUTION
         # Skipping 'SLURM_TASKS_PER_NODE' because this field has a weird format e.g. 2(x2)
+        key = ("parallel_configuration", os.getenv("SLURM_JOB_ID"))
+        cached = _allocation_cache.get(key)
+        if cached is not None:
+            return cached
         env_vars = ["SLURM_NTASKS", "SLURM_PROCID", "SLURM_LOCALID", "SLURM_NNODES"]
         env = {}
         for e in env_vars:
@@ -191,7 +234,8 @@ class SlurmScheduler(Scheduler):
         nodes_per_job = env["SLURM_NNODES"]
         local_world_size = world_size // nodes_per_job
         # local_world_size = env['SLURM_TASKS_PER_NODE']
-        return (world_size, rank, local_world_size, local_rank)
+        _allocation_cache[key] = (world_size, rank, local_world_size, local_rank)
+        return _allocation_cache[key]
 
     @classmethod
     def dynamically_configure_rendezvous_protocol(self, protocol: str) -> str:
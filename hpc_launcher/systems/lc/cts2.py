@@ -15,6 +15,8 @@ from hpc_launcher.schedulers.scheduler import Scheduler
 from hpc_launcher.schedulers.slurm import SlurmScheduler
 from hpc_launcher.systems.system import System, SystemParams
 import os
+import sys
+from types import MappingProxyType
 
 _h100_node = SystemParams(112, 4, "sm_90", 80.0, 8, "slurm")
 
@@ -46,6 +48,17 @@ _system_params = {
     ),
 }
 
+# Flat, read-only (system, partition) -> SystemParams view of _system_params.
+# Interned keys make the dict lookups pointer comparisons, and the proxy keeps
+# the mapping itself read-only (the shared SystemParams values stay mutable).
+_FLAT_PARAMS = MappingProxyType(
+    {
+        (sys.intern(s), sys.intern(p)): params
+        for s, (_, queues) in _system_params.items()
+        for p, params in queues.items()
+    }
+)
+
 
 class CTS2(System):
     """
@@ -53,16 +66,13 @@ class CTS2(System):
     """
 
     def __init__(self, system_name):
-        super().__init__(system_name, _system_params)
+        super().__init__(system_name, _system_params, _FLAT_PARAMS)
+        # None of these depend on the calling environment, so build the base
+        # list once and only append the auxiliary variables on each call
+        self._base_env_list = [("MPICH_OFI_NIC_POLICY", "GPU")]
 
     def environment_variables(self) -> list[tuple[str, str]]:
-        env_list = []
-        env_list.append(("MPICH_OFI_NIC_POLICY", "GPU"))
-
-        for i in self._aux_env_list:
-            env_list.append(i)
-
-        return env_list
+        return self._base_env_list + list(self._aux_env_list)
 
     def customize_scheduler(self, scheduler):
         if self.system_name == "matrix" and type(scheduler) is SlurmScheduler:
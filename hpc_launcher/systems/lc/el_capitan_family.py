@@ -16,6 +16,8 @@ from hpc_launcher.schedulers.flux import FluxScheduler
 from hpc_launcher.systems.system import System, SystemParams
 import os
 import re
+import sys
+from types import MappingProxyType
 
 import logging
 
@@ -70,6 +72,17 @@ _system_params = {
     ),
 }
 
+# Flat, read-only (system, partition) -> SystemParams view of _system_params.
+# Interned keys make the dict lookups pointer comparisons, and the proxy keeps
+# the mapping itself read-only (the shared SystemParams values stay mutable).
+_FLAT_PARAMS = MappingProxyType(
+    {
+        (sys.intern(s), sys.intern(p)): params
+        for s, (_, queues) in _system_params.items()
+        for p, params in queues.items()
+    }
+)
+
 
 class ElCapitan(System):
     """
@@ -77,9 +90,35 @@ class ElCapitan(System):
     """
 
     def __init__(self, system_name):
-        super().__init__(system_name, _system_params)
+        super().__init__(system_name, _system_params, _FLAT_PARAMS)
+        # Cached result of environment_variables() plus the key it was
+        # computed under
+        self._env_cache = None
 
     def environment_variables(self) -> list[tuple[str, str]]:
+        # The computed list only depends on a handful of environment variables
+        # (plus the communication protocol and any auxiliary variables), so
+        # reuse the cached result when none of them have changed - the hot
+        # submission path calls this repeatedly with the same inputs.
+        cache_key = (
+            os.environ.get("TMPDIR"),
+            os.getenv("CRAY_LD_LIBRARY_PATH"),
+            os.getenv("LBANN_USE_THIS_OFI_PLUGIN"),
+            os.getenv("ROCM_PATH"),
+            os.getenv("SYS_TYPE"),
+            os.getenv("NCCL_NET_PLUGIN"),
+            os.getenv("NCCL_NET"),
+            self.job_comm_protocol,
+            tuple(self._aux_env_list),
+        )
+        if self._env_cache is not None and self._env_cache[0] == cache_key:
+            # Return a shallow copy so that callers cannot mutate the cache
+            return list(self._env_cache[1])
+        env_list = self._compute_environment_variables()
+        self._env_cache = (cache_key, env_list)
+        return list(env_list)
+
+    def _compute_environment_variables(self) -> list[tuple[str, str]]:
         env_list = []
         env_list.append(("NCCL_NET_GDR_LEVEL", "3"))  # From HPE to avoid hangs
         env_list.append(
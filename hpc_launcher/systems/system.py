@@ -16,6 +16,7 @@ import json
 from typing import Optional
 import logging
 from hpc_launcher.schedulers.scheduler import Scheduler
+from hpc_launcher.schedulers import parse_env_list
 
 logger = logging.getLogger(__name__)
 
@@ -78,12 +79,15 @@ class System:
     jobs.
     """
 
-    def __init__(self, system_name, known_systems=None):
+    def __init__(self, system_name, known_systems=None, flat_params=None):
         self.system_name = system_name
         self.default_queue = None
         self.system_params = None
         self.active_system_params = None
         self.known_systems = known_systems
+        # Optional flat (system, queue) -> SystemParams map for single-lookup
+        # queue resolution
+        self._flat_params = flat_params
         if self.known_systems:
             if system_name in self.known_systems.keys():
                 (self.default_queue, self.system_params) = self.known_systems[
@@ -93,6 +97,9 @@ class System:
                 logger.warning("Could not auto-detect current system parameters")
         # Optional system level flag to indicate primary communication method for distributed jobs
         self.job_comm_protocol = None
+        # Cached formatted environment variable blocks, keyed on the lists
+        # they were formatted from
+        self._env_block_cache = {}
 
     _aux_env_list = []
 
@@ -102,6 +109,7 @@ class System:
         """
         for i in env_list:
             self._aux_env_list.append(i)
+        self._env_block_cache.clear()
 
     def environment_variables(self) -> list[tuple[str, str]]:
         """
@@ -121,6 +129,37 @@ class System:
         """
         return []
 
+    def environment_block(self) -> str:
+        """
+        Returns the environment variables formatted as a block of shell
+        lines. The formatted block is cached so that repeated launches from
+        the same process do not reformat an unchanged list.
+
+        :return: The formatted environment variables as a string.
+        """
+        env_vars = self.environment_variables()
+        key = tuple(env_vars)
+        cached = self._env_block_cache.get("env")
+        if cached is None or cached[0] != key:
+            cached = (key, "".join(parse_env_list(*e) for e in env_vars))
+            self._env_block_cache["env"] = cached
+        return cached[1]
+
+    def passthrough_environment_block(self) -> str:
+        """
+        Returns the passthrough environment variables formatted as a block of
+        shell export lines, cached like environment_block().
+
+        :return: The formatted passthrough environment variables as a string.
+        """
+        env_vars = self.passthrough_environment_variables()
+        key = tuple(env_vars)
+        cached = self._env_block_cache.get("passthrough")
+        if cached is None or cached[0] != key:
+            cached = (key, "".join(f"export {k}={v}\n" for k, v in env_vars))
+            self._env_block_cache["passthrough"] = cached
+        return cached[1]
+
     def customize_scheduler(self, scheduler: Scheduler):
         """
         Add any system specific customizations to the scheduler.
@@ -132,7 +171,15 @@ class System:
         if requested_queue:
             queue = requested_queue
         if self.system_params:
-            if queue not in self.system_params:
+            if self._flat_params is not None:
+                # One lookup in the flat map instead of the nested chain
+                params = self._flat_params.get((self.system_name, queue))
+                if params is None:
+                    logger.warning(
+                        f"Unknown queue {queue} on system {self.system_name} using system parameters from default queue {self.default_queue}"
+                    )
+                    params = self._flat_params[(self.system_name, self.default_queue)]
+            elif queue not in self.system_params:
                 logger.warning(
                     f"Unknown queue {queue} on system {self.system_name} using system parameters from default queue {self.default_queue}"
                 )
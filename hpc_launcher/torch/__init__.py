@@ -14,6 +14,7 @@
 from psutil import Process
 import inspect
 import os
+import sys
 
 # Optionally explicitly override HIP_VISIBLE_DEVICES with ROCR_VISIBLE_DEVICES before torch is imported
 # ROCR_VISIBLE_DEVICES - controls which GPUs a process can see
@@ -32,17 +33,24 @@ if os.getenv("ROCR_VISIBLE_DEVICES") and not unswap_rocr_hip_vis_dev:
     os.environ["HIP_VISIBLE_DEVICES"] = os.getenv("ROCR_VISIBLE_DEVICES")
     del os.environ["ROCR_VISIBLE_DEVICES"]
 
+_process = None
 affinity = None
-if hasattr(Process, "cpu_affinity") and inspect.isfunction(Process.cpu_affinity):
+# If torch has already been imported there is nothing to protect against, so
+# skip the /proc reads that constructing a Process requires
+if (
+    "torch" not in sys.modules
+    and hasattr(Process, "cpu_affinity")
+    and inspect.isfunction(Process.cpu_affinity)
+):
     # Save affinity before importing torch
-    affinity = Process().cpu_affinity()
+    _process = Process()
+    affinity = _process.cpu_affinity()
 
 import torch
 
 if affinity is not None:
     # Restore affinity after importing torch
-    Process().cpu_affinity(affinity)
-import os
+    _process.cpu_affinity(affinity)
 
 if torch.cuda.is_available():
     fraction_max_gpu_mem = float(os.getenv("HPC_LAUNCHER_MAX_GPU_MEM", 1.0))
@@ -20,8 +20,11 @@ from collections import OrderedDict
 from hpc_launcher.systems.lc.el_capitan_family import ElCapitan
 from hpc_launcher.schedulers import get_schedulers
 from hpc_launcher.schedulers.flux import FluxScheduler
+from hpc_launcher.schedulers.local import LocalScheduler
 from hpc_launcher.schedulers.slurm import SlurmScheduler
 from hpc_launcher.schedulers.lsf import LSFScheduler
+from hpc_launcher.systems.system import GenericSystem
+from io import StringIO
 
 import re
 
@@ -108,6 +111,41 @@ def test_cli_argument_override(sys: MagicMock, env: MagicMock, nodes, procs_per_
 
     print(f"Overriden command line: {cmd}")
 
+
+def test_launcher_script_argument_quoting():
+    system = GenericSystem()
+    scheduler = SlurmScheduler(1, 1, 0)
+    # Reset the class-level argument dicts shared across instances
+    scheduler.submit_only_args.clear()
+    scheduler.run_only_args.clear()
+    scheduler.common_launch_args.clear()
+
+    args = ["plain", "with space", "${HOME}/file", "a#b"]
+    script = scheduler.launcher_script(system, "echo", args, blocking=True)
+    run_line = script.rstrip("\n").rsplit("\n", 1)[-1]
+    # Callers pass unquoted literal arguments; the script quotes anything the
+    # shell would otherwise split, expand, or treat as a comment
+    assert "plain" in run_line
+    assert "'with space'" in run_line
+    assert "'${HOME}/file'" in run_line
+    assert "'a#b'" in run_line
+
+
+def test_local_launcher_script(tmp_path):
+    system = GenericSystem()
+    scheduler = LocalScheduler(1, 1, 0, work_dir=str(tmp_path))
+
+    script = scheduler.launcher_script(system, "echo", ["hello"], blocking=True)
+    assert "export RANK=0" in script
+    assert f"cd {tmp_path}" in script
+
+    # launch() streams through launcher_script_to, which must dispatch to the
+    # LocalScheduler override and produce the same script
+    streamed = StringIO()
+    scheduler.launcher_script_to(streamed, system, "echo", ["hello"], blocking=True)
+    assert streamed.getvalue() == script
+
+
 if __name__ == "__main__":
     test_cli_argument_override(MagicMock(), MagicMock(), 2, 2, 1, False, "slurm",
                                OrderedDict([("-ofastload", "off")]), False)